@@ -19,7 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 
-from src.utils.logging_config import setup_logging, get_log_file_path
+from src.utils.logging_config import setup_logging, shutdown_logging, get_log_file_path
 from src.ui.main_window import MainWindow
 
 
@@ -58,6 +58,7 @@ def main():
     exit_code = app.exec()
 
     logger.info(f"PortMaster shutting down (exit code: {exit_code})")
+    shutdown_logging()
     sys.exit(exit_code)
 
 
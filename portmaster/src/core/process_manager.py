@@ -2,6 +2,7 @@
 
 import subprocess
 import psutil
+from datetime import datetime
 from typing import Optional
 
 from .models import ProcessInfo
@@ -130,6 +131,7 @@ class ProcessManager:
         try:
             proc = psutil.Process(pid)
             with proc.oneshot():
+                create_time = proc.create_time()
                 info = {
                     'pid': pid,
                     'name': proc.name(),
@@ -138,7 +140,9 @@ class ProcessManager:
                     'exe': proc.exe() if proc.exe() else '',
                     'cwd': '',
                     'username': '',
-                    'create_time': proc.create_time(),
+                    'create_time': create_time,
+                    # Formatted once here so the UI never calls strftime per render
+                    'created_str': datetime.fromtimestamp(create_time).strftime("%Y-%m-%d %H:%M:%S") if create_time else '-',
                     'cpu_percent': proc.cpu_percent(),
                     'memory_info': {},
                     'connections': [],
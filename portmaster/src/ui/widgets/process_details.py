@@ -1,17 +1,32 @@
 """Process details panel widget."""
 
-from datetime import datetime
 from typing import Optional
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
-    QFormLayout, QPushButton, QTextEdit, QScrollArea
-)
+from PyQt6.QtGui import QPainter, QStaticText
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 
 from ...core import ProcessManager
 
 
+class StaticFormLabel(QLabel):
+    """Form label for fixed text, painted from a cached QStaticText layout."""
+
+    def __init__(self, text: str, parent: Optional[QWidget] = None):
+        super().__init__(text, parent)
+        self._static_text = QStaticText(text)
+        self._static_text.setTextFormat(Qt.TextFormat.PlainText)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+
+        rect = self.contentsRect()
+        y = rect.top() + (rect.height() - self.fontMetrics().height()) // 2
+        painter.drawStaticText(rect.left(), y, self._static_text)
+
+
 class ProcessDetailsWidget(QWidget):
     """Widget displaying detailed process information."""
 
@@ -19,13 +34,31 @@ class ProcessDetailsWidget(QWidget):
         super().__init__(parent)
         self.process_manager = ProcessManager()
         self.current_pid: Optional[int] = None
+        self._last_render_key: Optional[tuple] = None
+        self._ui_ready = False
 
-        self._setup_ui()
-
-    def _setup_ui(self):
+        # Only the title is built up front; the full details view is created
+        # on the first show_process() call
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        self.title_label = QLabel("Select a port to view process details")
+        self.title_label.setObjectName("titleLabel")
+        layout.addWidget(self.title_label)
+        layout.addStretch()
+
+    def _setup_ui(self):
+        """Build the details view (deferred until a process is first shown)."""
+        from PyQt6.QtWidgets import QGroupBox, QFormLayout, QPlainTextEdit, QScrollArea
+
+        self._ui_ready = True
+        layout = self.layout()
+
+        # Drop the placeholder title/stretch; the title moves into the scroll content
+        layout.removeWidget(self.title_label)
+        while layout.count():
+            layout.takeAt(0)
+
         # Scroll area for details
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -35,8 +68,6 @@ class ProcessDetailsWidget(QWidget):
         content_layout = QVBoxLayout(content)
 
         # Title
-        self.title_label = QLabel("Select a port to view process details")
-        self.title_label.setObjectName("titleLabel")
         content_layout.addWidget(self.title_label)
 
         # Basic info group
@@ -44,19 +75,19 @@ class ProcessDetailsWidget(QWidget):
         basic_layout = QFormLayout(basic_group)
 
         self.name_label = QLabel("-")
-        basic_layout.addRow("Name:", self.name_label)
+        basic_layout.addRow(StaticFormLabel("Name:"), self.name_label)
 
         self.pid_label = QLabel("-")
-        basic_layout.addRow("PID:", self.pid_label)
+        basic_layout.addRow(StaticFormLabel("PID:"), self.pid_label)
 
         self.status_label = QLabel("-")
-        basic_layout.addRow("Status:", self.status_label)
+        basic_layout.addRow(StaticFormLabel("Status:"), self.status_label)
 
         self.user_label = QLabel("-")
-        basic_layout.addRow("User:", self.user_label)
+        basic_layout.addRow(StaticFormLabel("User:"), self.user_label)
 
         self.created_label = QLabel("-")
-        basic_layout.addRow("Started:", self.created_label)
+        basic_layout.addRow(StaticFormLabel("Started:"), self.created_label)
 
         content_layout.addWidget(basic_group)
 
@@ -67,12 +98,12 @@ class ProcessDetailsWidget(QWidget):
         self.exe_label = QLabel("-")
         self.exe_label.setWordWrap(True)
         self.exe_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        path_layout.addRow("Executable:", self.exe_label)
+        path_layout.addRow(StaticFormLabel("Executable:"), self.exe_label)
 
         self.cwd_label = QLabel("-")
         self.cwd_label.setWordWrap(True)
         self.cwd_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        path_layout.addRow("Working Dir:", self.cwd_label)
+        path_layout.addRow(StaticFormLabel("Working Dir:"), self.cwd_label)
 
         content_layout.addWidget(path_group)
 
@@ -80,7 +111,7 @@ class ProcessDetailsWidget(QWidget):
         cmdline_group = QGroupBox("Command Line")
         cmdline_layout = QVBoxLayout(cmdline_group)
 
-        self.cmdline_text = QTextEdit()
+        self.cmdline_text = QPlainTextEdit()
         self.cmdline_text.setReadOnly(True)
         self.cmdline_text.setMaximumHeight(80)
         cmdline_layout.addWidget(self.cmdline_text)
@@ -92,11 +123,11 @@ class ProcessDetailsWidget(QWidget):
         family_layout = QFormLayout(family_group)
 
         self.parent_label = QLabel("-")
-        family_layout.addRow("Parent:", self.parent_label)
+        family_layout.addRow(StaticFormLabel("Parent:"), self.parent_label)
 
         self.children_label = QLabel("-")
         self.children_label.setWordWrap(True)
-        family_layout.addRow("Children:", self.children_label)
+        family_layout.addRow(StaticFormLabel("Children:"), self.children_label)
 
         content_layout.addWidget(family_group)
 
@@ -105,10 +136,10 @@ class ProcessDetailsWidget(QWidget):
         resource_layout = QFormLayout(resource_group)
 
         self.memory_label = QLabel("-")
-        resource_layout.addRow("Memory:", self.memory_label)
+        resource_layout.addRow(StaticFormLabel("Memory:"), self.memory_label)
 
         self.cpu_label = QLabel("-")
-        resource_layout.addRow("CPU:", self.cpu_label)
+        resource_layout.addRow(StaticFormLabel("CPU:"), self.cpu_label)
 
         content_layout.addWidget(resource_group)
 
@@ -116,8 +147,9 @@ class ProcessDetailsWidget(QWidget):
         conn_group = QGroupBox("Network Connections")
         conn_layout = QVBoxLayout(conn_group)
 
-        self.connections_text = QTextEdit()
+        self.connections_text = QPlainTextEdit()
         self.connections_text.setReadOnly(True)
+        self.connections_text.setMaximumBlockCount(200)
         self.connections_text.setMaximumHeight(100)
         conn_layout.addWidget(self.connections_text)
 
@@ -148,9 +180,35 @@ class ProcessDetailsWidget(QWidget):
 
     def show_process(self, pid: int):
         """Display details for a process."""
-        self.current_pid = pid
+        if not self._ui_ready:
+            self._setup_ui()
+
         details = self.process_manager.get_process_details(pid)
 
+        # Re-selecting an unchanged process is common; skip the re-render
+        render_key = None
+        if details and 'error' not in details:
+            render_key = (
+                pid,
+                details.get('status'),
+                len(details.get('connections', [])),
+                details.get('cpu_percent'),
+            )
+        if render_key is not None and render_key == self._last_render_key and pid == self.current_pid:
+            return
+
+        self.current_pid = pid
+        self._last_render_key = render_key
+
+        # Suppress repaints while the fields are filled so they land in one paint
+        self.setUpdatesEnabled(False)
+        try:
+            self._render_details(pid, details)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _render_details(self, pid: int, details: Optional[dict]):
+        """Populate all fields from a get_process_details() result."""
         if not details:
             self._clear()
             self.title_label.setText(f"Process {pid} not found")
@@ -169,15 +227,11 @@ class ProcessDetailsWidget(QWidget):
         self.status_label.setText(details['status'])
         self.user_label.setText(details.get('username', '-'))
 
-        if details.get('create_time'):
-            created = datetime.fromtimestamp(details['create_time'])
-            self.created_label.setText(created.strftime("%Y-%m-%d %H:%M:%S"))
-        else:
-            self.created_label.setText("-")
+        self.created_label.setText(details.get('created_str', '-'))
 
         self.exe_label.setText(details.get('exe', '-') or '-')
         self.cwd_label.setText(details.get('cwd', '-') or '-')
-        self.cmdline_text.setText(details.get('cmdline', '-') or '-')
+        self.cmdline_text.setPlainText(details.get('cmdline', '-') or '-')
 
         # Parent
         parent = details.get('parent')
@@ -217,9 +271,9 @@ class ProcessDetailsWidget(QWidget):
                 conn_lines.append(line)
             if len(conns) > 10:
                 conn_lines.append(f"... and {len(conns) - 10} more")
-            self.connections_text.setText("\n".join(conn_lines))
+            self.connections_text.setPlainText("\n".join(conn_lines))
         else:
-            self.connections_text.setText("No connections")
+            self.connections_text.setPlainText("No connections")
 
         # Enable buttons
         self.kill_btn.setEnabled(True)
@@ -228,6 +282,7 @@ class ProcessDetailsWidget(QWidget):
     def _clear(self):
         """Clear all fields."""
         self.current_pid = None
+        self._last_render_key = None
         self.name_label.setText("-")
         self.pid_label.setText("-")
         self.status_label.setText("-")
@@ -1,7 +1,12 @@
 """Logging configuration for PortMaster."""
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -26,6 +31,12 @@ SIMPLE_FORMAT = logging.Formatter(
     datefmt='%H:%M:%S'
 )
 
+# Per-call @timed instrumentation is debug-only; set PORTMASTER_PERF=1 to enable
+PERF_ENABLED = os.environ.get('PORTMASTER_PERF') == '1'
+
+# Background listener that performs the actual handler I/O
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     """
@@ -37,6 +48,8 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     Returns:
         Root logger for the application
     """
+    global _queue_listener
+
     # Get root logger for our app
     logger = logging.getLogger('portmaster')
     logger.setLevel(level)
@@ -49,26 +62,58 @@ def setup_logging(level: int = logging.DEBUG) -> logging.Logger:
     file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(DETAILED_FORMAT)
-    logger.addHandler(file_handler)
 
     # Console handler - less verbose
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(SIMPLE_FORMAT)
-    logger.addHandler(console_handler)
+
+    # Callers only enqueue records; the listener thread does the file/console I/O
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    # The listener thread is a daemon; drain the queue on any exit, including
+    # a crash before the event loop starts, so the final records reach the file
+    atexit.register(shutdown_logging)
 
     logger.info(f"Logging initialized. Log file: {LOG_FILE}")
 
     return logger
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    # stop() drains the queue before joining the listener thread
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.flush()
+    _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger for a specific module."""
     return logging.getLogger(f'portmaster.{name}')
 
 
 def timed(func):
-    """Decorator to log function execution time."""
+    """
+    Decorator to log function execution time.
+
+    Only active when PORTMASTER_PERF=1 is set at import time; otherwise the
+    function is returned unwrapped so production calls pay no timing overhead.
+    """
+    if not PERF_ENABLED:
+        return func
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         logger = get_logger('perf')
@@ -77,13 +122,13 @@ def timed(func):
             result = func(*args, **kwargs)
             elapsed = (time.perf_counter() - start) * 1000  # ms
             if elapsed > 100:  # Log slow operations (>100ms)
-                logger.warning(f"SLOW: {func.__qualname__} took {elapsed:.2f}ms")
-            else:
-                logger.debug(f"{func.__qualname__} took {elapsed:.2f}ms")
+                logger.warning("SLOW: %s took %.2fms", func.__qualname__, elapsed)
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s took %.2fms", func.__qualname__, elapsed)
             return result
         except Exception as e:
             elapsed = (time.perf_counter() - start) * 1000
-            logger.error(f"{func.__qualname__} failed after {elapsed:.2f}ms: {e}")
+            logger.error("%s failed after %.2fms: %s", func.__qualname__, elapsed, e)
             raise
     return wrapper
 
@@ -99,15 +144,16 @@ class PerfTimer:
 
     def __enter__(self):
         self.start = time.perf_counter()
-        self.logger.debug(f"Starting: {self.name}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Starting: %s", self.name)
         return self
 
     def __exit__(self, *args):
         self.elapsed = (time.perf_counter() - self.start) * 1000
         if self.elapsed > 100:
-            self.logger.warning(f"SLOW: {self.name} took {self.elapsed:.2f}ms")
-        else:
-            self.logger.debug(f"Completed: {self.name} in {self.elapsed:.2f}ms")
+            self.logger.warning("SLOW: %s took %.2fms", self.name, self.elapsed)
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Completed: %s in %.2fms", self.name, self.elapsed)
 
 
 def get_log_file_path() -> Path:
@@ -119,7 +165,7 @@ def get_recent_logs(lines: int = 100) -> str:
     """Get recent log entries."""
     try:
         with open(LOG_FILE, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-            return ''.join(all_lines[-lines:])
+            # Stream the file, keeping only the last `lines` entries in memory
+            return ''.join(deque(f, maxlen=lines))
     except Exception:
         return "Could not read log file"
@@ -5,10 +5,19 @@ VRAM Spy Configuration
 # Refresh rate in milliseconds
 REFRESH_RATE_MS = 1000
 
+# Slow-moving NVML fields (encoder/decoder utilization) are re-read every Nth poll
+SLOW_METRICS_POLL_EVERY = 4
+
 # History settings
 HISTORY_LENGTH_SECONDS = 300  # 5 minutes of history
 HISTORY_POINTS = HISTORY_LENGTH_SECONDS  # One point per second
 
+# Render history charts through OpenGL when PyOpenGL is installed
+CHART_USE_OPENGL = True
+
+# Antialias chart lines in the software (non-OpenGL) path; slower, but smoother on HiDPI
+CHART_ANTIALIAS = False
+
 # Colors (RGBA format for PyQt)
 COLORS = {
     # Gauge colors
@@ -71,3 +80,10 @@ WINDOW_MIN_HEIGHT = 700
 # Export settings
 EXPORT_FORMATS = ["csv", "json"]
 DEFAULT_EXPORT_FORMAT = "csv"
+
+# Pre-parsed QColor for each COLORS entry, so paint code never re-parses hex
+# strings. Read-only and shared: copy before mutating (QColor(QCOLORS[key])).
+from types import MappingProxyType
+from PyQt6.QtGui import QColor
+
+QCOLORS = MappingProxyType({key: QColor(value) for key, value in COLORS.items()})
@@ -4,47 +4,107 @@ Data Logger - Handles history buffering and CSV/JSON export
 
 import csv
 import json
+import threading
+import time
 from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from .metrics import GPUMetrics
 from config import HISTORY_POINTS
 
+# Plotted series kept in numpy ring buffers: series name -> GPUMetrics attribute
+HISTORY_SERIES = {
+    "vram": "vram_used_gb",
+    "utilization": "gpu_utilization",
+    "temperature": "temperature_celsius",
+    "power": "power_draw_watts",
+}
+
 
 class DataLogger:
     """
     Buffers GPU metrics history and handles data export.
+
+    Thread-safe: add_metrics() may be called from the polling thread while the
+    UI thread reads history. History arrays are copied out of the ring
+    buffers under the lock, so callers never see a concurrent write.
     """
 
     def __init__(self, max_points: int = HISTORY_POINTS):
         self.max_points = max_points
         self.history: deque[GPUMetrics] = deque(maxlen=max_points)
+        self._lock = threading.Lock()
+
+        # Ring buffers are twice max_points long and each sample is written to
+        # both halves, so the current window is always one contiguous slice
+        self._times = np.zeros(2 * max_points, dtype=np.int64)
+        self._series = {
+            name: np.zeros(2 * max_points, dtype=np.float32)
+            for name in HISTORY_SERIES
+        }
+        self._write_pos = 0
+        self._count = 0
 
     def add_metrics(self, metrics: GPUMetrics):
         """Add a metrics snapshot to history"""
-        self.history.append(metrics)
+        values = [getattr(metrics, attr) for attr in HISTORY_SERIES.values()]
+
+        with self._lock:
+            self.history.append(metrics)
+
+            i = self._write_pos
+            j = i + self.max_points
+            self._times[i] = self._times[j] = metrics.timestamp
+            for buf, value in zip(self._series.values(), values):
+                buf[i] = buf[j] = value
+
+            self._write_pos = (i + 1) % self.max_points
+            self._count = min(self._count + 1, self.max_points)
 
     def clear(self):
         """Clear all history"""
-        self.history.clear()
+        with self._lock:
+            self.history.clear()
+            self._write_pos = 0
+            self._count = 0
+
+    def snapshot(self) -> list[GPUMetrics]:
+        """Copy of the recorded metrics, safe to iterate while polling continues"""
+        with self._lock:
+            return list(self.history)
+
+    def _window(self) -> slice:
+        """Slice of the ring buffers holding the recorded points, oldest first"""
+        end = self._write_pos + self.max_points
+        return slice(end - self._count, end)
+
+    def _series_history(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Get (seconds_ago, values) for a plotted series"""
+        with self._lock:
+            window = self._window()
+            # Negative so newest is at right
+            seconds_ago = (self._times[window] - time.monotonic_ns()) / 1e9
+            return seconds_ago, self._series[name][window].copy()
 
     @property
     def length(self) -> int:
         """Number of recorded data points"""
         return len(self.history)
 
-    def get_time_series(self, field: str) -> tuple[list[datetime], list[float]]:
+    def get_time_series(self, field: str) -> tuple[list[float], list[float]]:
         """
         Get time series data for a specific field.
-        Returns (timestamps, values) tuple.
+        Returns (timestamps, values) tuple, timestamps in epoch seconds.
         """
         timestamps = []
         values = []
 
-        for metrics in self.history:
-            timestamps.append(metrics.timestamp)
+        for metrics in self.snapshot():
+            timestamps.append(metrics.timestamp_wall)
             value = getattr(metrics, field, 0)
             if value is None:
                 value = 0
@@ -52,69 +112,31 @@ class DataLogger:
 
         return timestamps, values
 
-    def get_vram_history(self) -> tuple[list[float], list[float]]:
-        """Get VRAM usage history as (seconds_ago, gb_used) for plotting"""
-        if not self.history:
-            return [], []
-
-        now = datetime.now()
-        seconds_ago = []
-        values = []
-
-        for metrics in self.history:
-            delta = (now - metrics.timestamp).total_seconds()
-            seconds_ago.append(-delta)  # Negative so newest is at right
-            values.append(metrics.vram_used_gb)
+    def get_all_history(self) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        Get every plotted series in one call as (seconds_ago, {name: values}),
+        all sharing the same x-axis.
+        """
+        with self._lock:
+            window = self._window()
+            seconds_ago = (self._times[window] - time.monotonic_ns()) / 1e9
+            return seconds_ago, {name: buf[window].copy() for name, buf in self._series.items()}
 
-        return seconds_ago, values
+    def get_vram_history(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get VRAM usage history as (seconds_ago, gb_used) for plotting"""
+        return self._series_history("vram")
 
-    def get_utilization_history(self) -> tuple[list[float], list[float]]:
+    def get_utilization_history(self) -> tuple[np.ndarray, np.ndarray]:
         """Get GPU utilization history"""
-        if not self.history:
-            return [], []
-
-        now = datetime.now()
-        seconds_ago = []
-        values = []
-
-        for metrics in self.history:
-            delta = (now - metrics.timestamp).total_seconds()
-            seconds_ago.append(-delta)
-            values.append(metrics.gpu_utilization)
+        return self._series_history("utilization")
 
-        return seconds_ago, values
-
-    def get_temperature_history(self) -> tuple[list[float], list[float]]:
+    def get_temperature_history(self) -> tuple[np.ndarray, np.ndarray]:
         """Get temperature history"""
-        if not self.history:
-            return [], []
-
-        now = datetime.now()
-        seconds_ago = []
-        values = []
+        return self._series_history("temperature")
 
-        for metrics in self.history:
-            delta = (now - metrics.timestamp).total_seconds()
-            seconds_ago.append(-delta)
-            values.append(metrics.temperature_celsius)
-
-        return seconds_ago, values
-
-    def get_power_history(self) -> tuple[list[float], list[float]]:
+    def get_power_history(self) -> tuple[np.ndarray, np.ndarray]:
         """Get power draw history"""
-        if not self.history:
-            return [], []
-
-        now = datetime.now()
-        seconds_ago = []
-        values = []
-
-        for metrics in self.history:
-            delta = (now - metrics.timestamp).total_seconds()
-            seconds_ago.append(-delta)
-            values.append(metrics.power_draw_watts)
-
-        return seconds_ago, values
+        return self._series_history("power")
 
     def export_csv(self, filepath: Optional[str] = None) -> str:
         """
@@ -126,17 +148,16 @@ class DataLogger:
             filepath = f"vram_spy_export_{timestamp}.csv"
 
         path = Path(filepath)
+        history = self.snapshot()
 
         with open(path, "w", newline="", encoding="utf-8") as f:
-            if not self.history:
+            if not history:
                 return str(path)
 
-            # Get field names from first entry
-            fieldnames = list(self.history[0].to_dict().keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=GPUMetrics.export_fields())
             writer.writeheader()
 
-            for metrics in self.history:
+            for metrics in history:
                 writer.writerow(metrics.to_dict())
 
         return str(path)
@@ -151,11 +172,12 @@ class DataLogger:
             filepath = f"vram_spy_export_{timestamp}.json"
 
         path = Path(filepath)
+        history = self.snapshot()
 
         data = {
             "export_time": datetime.now().isoformat(),
-            "data_points": len(self.history),
-            "metrics": [m.to_dict() for m in self.history]
+            "data_points": len(history),
+            "metrics": [m.to_dict() for m in history]
         }
 
         with open(path, "w", encoding="utf-8") as f:
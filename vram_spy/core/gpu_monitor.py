@@ -6,6 +6,25 @@ import pynvml
 from typing import Optional
 from .metrics import GPUMetrics, ProcessInfo
 from .process_tracker import ProcessTracker
+from config import SLOW_METRICS_POLL_EVERY
+
+# NVML entry points used on every poll, bound once to skip the module
+# attribute lookup per call
+_get_memory_info = pynvml.nvmlDeviceGetMemoryInfo
+_get_utilization_rates = pynvml.nvmlDeviceGetUtilizationRates
+_get_temperature = pynvml.nvmlDeviceGetTemperature
+_get_power_usage = pynvml.nvmlDeviceGetPowerUsage
+_get_enforced_power_limit = pynvml.nvmlDeviceGetEnforcedPowerLimit
+_get_clock_info = pynvml.nvmlDeviceGetClockInfo
+_get_fan_speed = pynvml.nvmlDeviceGetFanSpeed
+_get_performance_state = pynvml.nvmlDeviceGetPerformanceState
+_get_pcie_link_gen = pynvml.nvmlDeviceGetCurrPcieLinkGeneration
+_get_pcie_link_width = pynvml.nvmlDeviceGetCurrPcieLinkWidth
+_get_pcie_throughput = pynvml.nvmlDeviceGetPcieThroughput
+_get_encoder_utilization = pynvml.nvmlDeviceGetEncoderUtilization
+_get_decoder_utilization = pynvml.nvmlDeviceGetDecoderUtilization
+_get_compute_processes = pynvml.nvmlDeviceGetComputeRunningProcesses
+_get_graphics_processes = pynvml.nvmlDeviceGetGraphicsRunningProcesses
 
 
 class GPUMonitor:
@@ -23,6 +42,11 @@ class GPUMonitor:
         self._driver_version = ""
         self._cuda_version = ""
 
+        # Cached slow-moving fields, refreshed every SLOW_METRICS_POLL_EVERY polls
+        self._poll_count = 0
+        self._encoder_utilization = 0.0
+        self._decoder_utilization = 0.0
+
     def initialize(self) -> bool:
         """Initialize NVML and get device handle"""
         try:
@@ -89,7 +113,7 @@ class GPUMonitor:
 
         # Memory info
         try:
-            mem_info = pynvml.nvmlDeviceGetMemoryInfo(self.handle)
+            mem_info = _get_memory_info(self.handle)
             metrics.vram_total_bytes = mem_info.total
             metrics.vram_used_bytes = mem_info.used
             metrics.vram_free_bytes = mem_info.free
@@ -98,7 +122,7 @@ class GPUMonitor:
 
         # Utilization
         try:
-            util = pynvml.nvmlDeviceGetUtilizationRates(self.handle)
+            util = _get_utilization_rates(self.handle)
             metrics.gpu_utilization = util.gpu
             metrics.memory_utilization = util.memory
         except pynvml.NVMLError:
@@ -106,7 +130,7 @@ class GPUMonitor:
 
         # Temperature
         metrics.temperature_celsius = self._safe_get(
-            pynvml.nvmlDeviceGetTemperature,
+            _get_temperature,
             self.handle,
             pynvml.NVML_TEMPERATURE_GPU,
             default=0
@@ -115,33 +139,33 @@ class GPUMonitor:
         # Power
         try:
             # Power draw is in milliwatts
-            power_mw = pynvml.nvmlDeviceGetPowerUsage(self.handle)
+            power_mw = _get_power_usage(self.handle)
             metrics.power_draw_watts = power_mw / 1000.0
         except pynvml.NVMLError:
             pass
 
         try:
             # Power limit is in milliwatts
-            limit_mw = pynvml.nvmlDeviceGetEnforcedPowerLimit(self.handle)
+            limit_mw = _get_enforced_power_limit(self.handle)
             metrics.power_limit_watts = limit_mw / 1000.0
         except pynvml.NVMLError:
             pass
 
         # Clocks
         metrics.graphics_clock_mhz = self._safe_get(
-            pynvml.nvmlDeviceGetClockInfo,
+            _get_clock_info,
             self.handle,
             pynvml.NVML_CLOCK_GRAPHICS,
             default=0
         )
         metrics.memory_clock_mhz = self._safe_get(
-            pynvml.nvmlDeviceGetClockInfo,
+            _get_clock_info,
             self.handle,
             pynvml.NVML_CLOCK_MEM,
             default=0
         )
         metrics.sm_clock_mhz = self._safe_get(
-            pynvml.nvmlDeviceGetClockInfo,
+            _get_clock_info,
             self.handle,
             pynvml.NVML_CLOCK_SM,
             default=0
@@ -149,48 +173,50 @@ class GPUMonitor:
 
         # Fan speed
         try:
-            metrics.fan_speed_percent = pynvml.nvmlDeviceGetFanSpeed(self.handle)
+            metrics.fan_speed_percent = _get_fan_speed(self.handle)
         except pynvml.NVMLError:
             # Some GPUs don't report fan speed
             metrics.fan_speed_percent = 0
 
         # Performance state
         try:
-            pstate = pynvml.nvmlDeviceGetPerformanceState(self.handle)
+            pstate = _get_performance_state(self.handle)
             metrics.performance_state = f"P{pstate}"
         except pynvml.NVMLError:
             metrics.performance_state = "N/A"
 
         # PCIe info
         try:
-            metrics.pcie_gen = pynvml.nvmlDeviceGetCurrPcieLinkGeneration(self.handle)
-            metrics.pcie_width = pynvml.nvmlDeviceGetCurrPcieLinkWidth(self.handle)
+            metrics.pcie_gen = _get_pcie_link_gen(self.handle)
+            metrics.pcie_width = _get_pcie_link_width(self.handle)
         except pynvml.NVMLError:
             pass
 
         # PCIe throughput
         try:
-            metrics.pcie_tx_bytes_per_sec = pynvml.nvmlDeviceGetPcieThroughput(
+            metrics.pcie_tx_bytes_per_sec = _get_pcie_throughput(
                 self.handle, pynvml.NVML_PCIE_UTIL_TX_BYTES
             ) * 1024  # KB/s to B/s
-            metrics.pcie_rx_bytes_per_sec = pynvml.nvmlDeviceGetPcieThroughput(
+            metrics.pcie_rx_bytes_per_sec = _get_pcie_throughput(
                 self.handle, pynvml.NVML_PCIE_UTIL_RX_BYTES
             ) * 1024
         except pynvml.NVMLError:
             pass
 
-        # Encoder/Decoder utilization
-        try:
-            enc_util, _ = pynvml.nvmlDeviceGetEncoderUtilization(self.handle)
-            metrics.encoder_utilization = enc_util
-        except pynvml.NVMLError:
-            pass
+        # Encoder/Decoder utilization (cached between slow polls)
+        if self._poll_count % SLOW_METRICS_POLL_EVERY == 0:
+            try:
+                self._encoder_utilization, _ = _get_encoder_utilization(self.handle)
+            except pynvml.NVMLError:
+                pass
 
-        try:
-            dec_util, _ = pynvml.nvmlDeviceGetDecoderUtilization(self.handle)
-            metrics.decoder_utilization = dec_util
-        except pynvml.NVMLError:
-            pass
+            try:
+                self._decoder_utilization, _ = _get_decoder_utilization(self.handle)
+            except pynvml.NVMLError:
+                pass
+        self._poll_count += 1
+        metrics.encoder_utilization = self._encoder_utilization
+        metrics.decoder_utilization = self._decoder_utilization
 
         # Per-process information
         metrics.processes = self._get_process_list()
@@ -206,7 +232,7 @@ class GPUMonitor:
 
         # Get compute processes
         try:
-            compute_procs = pynvml.nvmlDeviceGetComputeRunningProcesses(self.handle)
+            compute_procs = _get_compute_processes(self.handle)
             for proc in compute_procs:
                 name = self.process_tracker.get_process_name(proc.pid)
                 processes.append(ProcessInfo(
@@ -219,7 +245,7 @@ class GPUMonitor:
 
         # Get graphics processes
         try:
-            graphics_procs = pynvml.nvmlDeviceGetGraphicsRunningProcesses(self.handle)
+            graphics_procs = _get_graphics_processes(self.handle)
             existing_pids = {p.pid for p in processes}
 
             for proc in graphics_procs:
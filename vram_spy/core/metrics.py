@@ -2,12 +2,20 @@
 Data structures for GPU metrics
 """
 
+import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _format_iso(epoch_seconds: int) -> str:
+    """ISO 8601 local time for a whole-second epoch timestamp"""
+    return datetime.fromtimestamp(epoch_seconds).isoformat()
+
+
+@dataclass(slots=True)
 class ProcessInfo:
     """Information about a process using GPU memory"""
     pid: int
@@ -27,10 +35,13 @@ class ProcessInfo:
         return self.vram_used_bytes / (1024 * 1024 * 1024)
 
 
-@dataclass
+@dataclass(slots=True)
 class GPUMetrics:
     """Complete GPU metrics snapshot"""
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.monotonic_ns)  # Monotonic ns, for intervals
+    # Wall-clock epoch ns, read separately: a fixed monotonic offset drifts
+    # after a suspend or a clock/NTP step
+    wall_ns: int = field(default_factory=time.time_ns)
 
     # Device info
     device_name: str = ""
@@ -100,24 +111,47 @@ class GPUMetrics:
             return 0.0
         return (self.power_draw_watts / self.power_limit_watts) * 100
 
+    @property
+    def timestamp_wall(self) -> float:
+        """Wall-clock time of the snapshot in seconds since the epoch"""
+        return self.wall_ns / 1e9
+
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO timestamp with microseconds; the whole-second prefix is memoized"""
+        seconds, ns = divmod(self.wall_ns, 1_000_000_000)
+        return f"{_format_iso(seconds)}.{ns // 1000:06d}"
+
+    # (export key, attribute, round digits or None) in export column order,
+    # between the leading timestamp and the trailing process_count
+    _EXPORT_SCHEMA = (
+        ("device_name", "device_name", None),
+        ("vram_total_gb", "vram_total_gb", 2),
+        ("vram_used_gb", "vram_used_gb", 2),
+        ("vram_used_percent", "vram_used_percent", 1),
+        ("gpu_utilization", "gpu_utilization", 1),
+        ("memory_utilization", "memory_utilization", 1),
+        ("temperature_celsius", "temperature_celsius", 1),
+        ("power_draw_watts", "power_draw_watts", 1),
+        ("power_limit_watts", "power_limit_watts", 1),
+        ("graphics_clock_mhz", "graphics_clock_mhz", None),
+        ("memory_clock_mhz", "memory_clock_mhz", None),
+        ("fan_speed_percent", "fan_speed_percent", 1),
+        ("performance_state", "performance_state", None),
+        ("encoder_utilization", "encoder_utilization", 1),
+        ("decoder_utilization", "decoder_utilization", 1),
+    )
+
+    @classmethod
+    def export_fields(cls) -> list[str]:
+        """Column names produced by to_dict(), in order"""
+        return ["timestamp", *(key for key, _, _ in cls._EXPORT_SCHEMA), "process_count"]
+
     def to_dict(self) -> dict:
         """Convert to dictionary for export"""
-        return {
-            "timestamp": self.timestamp.isoformat(),
-            "device_name": self.device_name,
-            "vram_total_gb": round(self.vram_total_gb, 2),
-            "vram_used_gb": round(self.vram_used_gb, 2),
-            "vram_used_percent": round(self.vram_used_percent, 1),
-            "gpu_utilization": round(self.gpu_utilization, 1),
-            "memory_utilization": round(self.memory_utilization, 1),
-            "temperature_celsius": round(self.temperature_celsius, 1),
-            "power_draw_watts": round(self.power_draw_watts, 1),
-            "power_limit_watts": round(self.power_limit_watts, 1),
-            "graphics_clock_mhz": self.graphics_clock_mhz,
-            "memory_clock_mhz": self.memory_clock_mhz,
-            "fan_speed_percent": round(self.fan_speed_percent, 1),
-            "performance_state": self.performance_state,
-            "encoder_utilization": round(self.encoder_utilization, 1),
-            "decoder_utilization": round(self.decoder_utilization, 1),
-            "process_count": len(self.processes),
-        }
+        data = {"timestamp": self.timestamp_iso}
+        for key, attr, digits in self._EXPORT_SCHEMA:
+            value = getattr(self, attr)
+            data[key] = value if digits is None else round(value, digits)
+        data["process_count"] = len(self.processes)
+        return data
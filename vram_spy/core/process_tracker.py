@@ -3,38 +3,84 @@ Process tracker for resolving process names from PIDs
 """
 
 import psutil
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Optional
 
+# Maximum number of PIDs kept in the process cache (least recently used evicted)
+PROCESS_CACHE_SIZE = 512
+
 
 class ProcessTracker:
     """Tracks and resolves process information from PIDs"""
 
-    def __init__(self):
-        self._process_cache: dict[int, str] = {}
+    def __init__(self, max_entries: int = PROCESS_CACHE_SIZE):
+        self.max_entries = max_entries
+        # pid -> (Process, resolved name or None until get_process_name reads it)
+        self._process_cache: OrderedDict[int, tuple[psutil.Process, Optional[str]]] = OrderedDict()
+        # Static per-process fields keyed by (pid, create_time) for PID-reuse safety
+        self._info_cache: OrderedDict[tuple[int, float], dict] = OrderedDict()
+
+    def _get_or_cache_entry(self, pid: int, verify: bool = False) -> tuple[psutil.Process, Optional[str]]:
+        """
+        Return the cached (Process, name) entry for a PID, creating it on first use.
+        With verify=True the cached object's create_time is checked against the
+        live process (is_running), so a reused PID gets a fresh entry.
+        Raises psutil.NoSuchProcess if the PID does not exist.
+        """
+        entry = self._process_cache.get(pid)
+        if entry is not None:
+            if not verify or entry[0].is_running():
+                self._process_cache.move_to_end(pid)
+                return entry
+            del self._process_cache[pid]
+
+        # psutil.Process records create_time on construction
+        entry = (psutil.Process(pid), None)
+        self._process_cache[pid] = entry
+        if len(self._process_cache) > self.max_entries:
+            self._process_cache.popitem(last=False)
+        return entry
+
+    def _get_or_cache_process(self, pid: int, verify: bool = False) -> psutil.Process:
+        """Return the cached psutil.Process for a PID (see _get_or_cache_entry)"""
+        return self._get_or_cache_entry(pid, verify)[0]
+
+    def get_process(self, pid: int) -> Optional[psutil.Process]:
+        """
+        Get a cached, PID-reuse-checked psutil.Process for batched queries
+        (e.g. `with proc.oneshot(): ...`). Returns None if the process is gone.
+        """
+        try:
+            return self._get_or_cache_process(pid, verify=True)
+        except psutil.NoSuchProcess:
+            self.invalidate(pid)
+            return None
 
     def get_process_name(self, pid: int) -> str:
         """
         Get process name from PID with caching.
-        Returns 'Unknown' if process cannot be found.
+        The name is stored with the cached Process, so a cache hit makes no
+        syscalls (psutil only memoizes name() on Windows). Cached entries are
+        trusted without re-checking that the PID is alive; the cache is
+        bounded by LRU eviction instead of per-tick scans.
+        Returns 'PID <pid>' if process cannot be found.
         """
-        # Check cache first
-        if pid in self._process_cache:
-            # Verify process still exists
-            if psutil.pid_exists(pid):
-                return self._process_cache[pid]
-            else:
-                # Process ended, remove from cache
-                del self._process_cache[pid]
-
-        # Look up process
         try:
-            proc = psutil.Process(pid)
-            name = proc.name()
-            self._process_cache[pid] = name
+            proc, name = self._get_or_cache_entry(pid)
+            if name is None:
+                name = proc.name()
+                self._process_cache[pid] = (proc, name)
             return name
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        except psutil.NoSuchProcess:  # Includes ZombieProcess
+            self.invalidate(pid)
             return f"PID {pid}"
+        except psutil.AccessDenied:
+            return f"PID {pid}"
+
+    def invalidate(self, pid: int):
+        """Drop a PID from the cache (e.g. once it is known to have exited)"""
+        self._process_cache.pop(pid, None)
 
     def get_process_info(self, pid: int) -> Optional[dict]:
         """
@@ -42,27 +88,32 @@ class ProcessTracker:
         Returns None if process cannot be accessed.
         """
         try:
-            proc = psutil.Process(pid)
-            return {
-                "pid": pid,
-                "name": proc.name(),
-                "exe": proc.exe() if proc.exe() else None,
-                "cmdline": " ".join(proc.cmdline()) if proc.cmdline() else None,
-                "create_time": proc.create_time(),
-                "status": proc.status(),
-            }
+            proc = self._get_or_cache_process(pid, verify=True)
+            with proc.oneshot():
+                key = (pid, proc.create_time())
+                static = self._info_cache.get(key)
+                if static is None:
+                    # name/exe/cmdline never change for a given process, read them once
+                    attrs = proc.as_dict(attrs=["name", "exe", "cmdline"])
+                    static = {
+                        "pid": pid,
+                        "name": attrs["name"],
+                        "exe": attrs["exe"] or None,
+                        "cmdline": " ".join(attrs["cmdline"]) if attrs["cmdline"] else None,
+                        "create_time": key[1],
+                    }
+                    self._info_cache[key] = static
+                    if len(self._info_cache) > self.max_entries:
+                        self._info_cache.popitem(last=False)
+                else:
+                    self._info_cache.move_to_end(key)
+
+                return {**static, "status": proc.status()}
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             return None
 
     def clear_cache(self):
-        """Clear the process name cache"""
+        """Clear the process and info caches"""
         self._process_cache.clear()
+        self._info_cache.clear()
 
-    def cleanup_dead_processes(self):
-        """Remove dead processes from cache"""
-        dead_pids = [
-            pid for pid in self._process_cache
-            if not psutil.pid_exists(pid)
-        ]
-        for pid in dead_pids:
-            del self._process_cache[pid]
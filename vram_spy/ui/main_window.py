@@ -2,14 +2,15 @@
 Main Window - Central application window for VRAM Spy
 """
 
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QLabel, QFrame, QPushButton, QFileDialog,
     QMessageBox, QSplitter, QStatusBar
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, QObject, pyqtSignal
 from PyQt6.QtGui import QFont, QAction
 
 from config import (
@@ -23,10 +24,164 @@ from core.metrics import GPUMetrics
 from .widgets.gauge_widget import GaugeWidget
 from .widgets.memory_bar import MemoryBar
 from .widgets.process_table import ProcessTable
-from .widgets.history_chart import HistoryChart, MultiLineChart
+from .widgets.history_chart import HistoryChart
 from .widgets.metrics_panel import MetricsPanel
 
 
+# Style sheets are built once at import; frames sharing a look share one
+# string so Qt parses each distinct sheet a single time
+MAIN_WINDOW_QSS = f"""
+    QMainWindow {{
+        background-color: {COLORS['background']};
+    }}
+    QWidget {{
+        color: {COLORS['text_primary']};
+        font-family: 'Segoe UI', sans-serif;
+    }}
+    QTabWidget::pane {{
+        border: 1px solid {COLORS['vram_border']};
+        border-radius: 4px;
+        background-color: {COLORS['surface']};
+    }}
+    QTabBar::tab {{
+        background-color: {COLORS['surface']};
+        color: {COLORS['text_secondary']};
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }}
+    QTabBar::tab:selected {{
+        background-color: {COLORS['accent']};
+        color: {COLORS['text_primary']};
+    }}
+    QTabBar::tab:hover:!selected {{
+        background-color: {COLORS['table_alternate']};
+    }}
+    QPushButton {{
+        background-color: {COLORS['accent']};
+        color: {COLORS['text_primary']};
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: #8b5cf6;
+    }}
+    QPushButton:pressed {{
+        background-color: #6d28d9;
+    }}
+    QSplitter::handle {{
+        background-color: {COLORS['vram_border']};
+    }}
+"""
+
+MENUBAR_QSS = f"""
+    QMenuBar {{
+        background-color: {COLORS['surface']};
+        color: {COLORS['text_primary']};
+        padding: 4px;
+    }}
+    QMenuBar::item:selected {{
+        background-color: {COLORS['accent']};
+    }}
+    QMenu {{
+        background-color: {COLORS['surface']};
+        color: {COLORS['text_primary']};
+        border: 1px solid {COLORS['vram_border']};
+    }}
+    QMenu::item:selected {{
+        background-color: {COLORS['accent']};
+    }}
+"""
+
+SURFACE_FRAME_QSS = f"""
+    QFrame {{
+        background-color: {COLORS['surface']};
+        border-radius: 8px;
+        padding: 10px;
+    }}
+"""
+
+GAUGES_FRAME_QSS = f"""
+    QFrame {{
+        background-color: {COLORS['surface']};
+        border-radius: 8px;
+    }}
+"""
+
+STATUSBAR_QSS = f"""
+    QStatusBar {{
+        background-color: {COLORS['surface']};
+        color: {COLORS['text_secondary']};
+        border-top: 1px solid {COLORS['vram_border']};
+    }}
+"""
+
+SECONDARY_TEXT_QSS = f"color: {COLORS['text_secondary']};"
+
+# Charts are replotted on every Nth applied snapshot
+CHART_UPDATE_EVERY = 2
+
+# The process table is rebuilt every Nth snapshot, or sooner if the PID set changes
+PROCESS_TABLE_UPDATE_EVERY = 3
+
+
+class MetricsWorker(QObject):
+    """
+    Polls the GPU monitor from a background thread so NVML calls never
+    block painting on the UI thread.
+    """
+    metrics_ready = pyqtSignal(object)  # GPUMetrics, or None on read failure
+
+    def __init__(self, gpu_monitor: GPUMonitor, data_logger: DataLogger):
+        super().__init__()
+        self.gpu_monitor = gpu_monitor
+        self.data_logger = data_logger
+        self._timer: Optional[QTimer] = None
+
+    def start(self):
+        """Start the poll timer (called once the worker thread is running)"""
+        # Created here so the timer lives in, and fires on, the worker thread
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.poll)
+        self._timer.start(REFRESH_RATE_MS)
+
+    def poll(self):
+        """Collect and record one metrics snapshot, then hand it to the UI thread"""
+        metrics = self.gpu_monitor.get_metrics()
+        if metrics is not None:
+            self.data_logger.add_metrics(metrics)
+        self.metrics_ready.emit(metrics)
+
+
+class WidgetsUpdateCoalescer(QObject):
+    """
+    Collapses a burst of metrics snapshots into a single widget update.
+    Snapshots arriving before the event loop next runs its timers replace
+    each other, and only the newest is applied.
+    """
+
+    def __init__(self, apply: Callable[[Optional[GPUMetrics]], None], parent=None):
+        super().__init__(parent)
+        self._apply = apply
+        self._pending: Optional[GPUMetrics] = None
+        self._scheduled = False
+
+    def submit(self, metrics: Optional[GPUMetrics]):
+        """Queue a snapshot, scheduling a flush if one isn't already pending"""
+        self._pending = metrics
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        self._scheduled = False
+        metrics, self._pending = self._pending, None
+        self._apply(metrics)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window for VRAM Spy.
@@ -37,13 +192,27 @@ class MainWindow(QMainWindow):
         self.gpu_monitor = GPUMonitor()
         self.data_logger = DataLogger()
         self.current_metrics: Optional[GPUMetrics] = None
+        self._poll_thread: Optional[QThread] = None
+        self._poll_worker: Optional[MetricsWorker] = None
+        self._coalescer = WidgetsUpdateCoalescer(self._update_metrics, self)
+
+        # Dirty tracking: last applied values and update cadence
+        self._last_memory: tuple[int, int] = (-1, -1)
+        self._chart_tick = CHART_UPDATE_EVERY - 1  # Plot the first snapshot
+        self._process_tick = 0
+        self._last_pids: Optional[set[int]] = None
+
+        # Values that are static or rarely change; only pushed to widgets on change
+        self._static_labels_set = False
+        self._last_power_limit = 0.0
+        self._last_vram_total = 0.0
 
         self._setup_window()
         self._setup_menubar()
         self._setup_ui()
         self._setup_statusbar()
 
-        # Initialize GPU monitoring before starting timer
+        # Initialize GPU monitoring before starting the poller
         if not self.gpu_monitor.initialize():
             QMessageBox.critical(
                 self,
@@ -54,9 +223,8 @@ class MainWindow(QMainWindow):
                 "2. NVIDIA drivers are properly installed\n"
                 "3. The pynvml package is installed"
             )
-            self.timer = None  # No timer if GPU init failed
         else:
-            self._setup_timer()
+            self._start_polling()
 
     def _setup_window(self):
         """Configure the main window"""
@@ -65,74 +233,12 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
 
         # Dark theme background
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {COLORS['background']};
-            }}
-            QWidget {{
-                color: {COLORS['text_primary']};
-                font-family: 'Segoe UI', sans-serif;
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {COLORS['vram_border']};
-                border-radius: 4px;
-                background-color: {COLORS['surface']};
-            }}
-            QTabBar::tab {{
-                background-color: {COLORS['surface']};
-                color: {COLORS['text_secondary']};
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {COLORS['accent']};
-                color: {COLORS['text_primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {COLORS['table_alternate']};
-            }}
-            QPushButton {{
-                background-color: {COLORS['accent']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #8b5cf6;
-            }}
-            QPushButton:pressed {{
-                background-color: #6d28d9;
-            }}
-            QSplitter::handle {{
-                background-color: {COLORS['vram_border']};
-            }}
-        """)
+        self.setStyleSheet(MAIN_WINDOW_QSS)
 
     def _setup_menubar(self):
         """Setup the menu bar"""
         menubar = self.menuBar()
-        menubar.setStyleSheet(f"""
-            QMenuBar {{
-                background-color: {COLORS['surface']};
-                color: {COLORS['text_primary']};
-                padding: 4px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {COLORS['accent']};
-            }}
-            QMenu {{
-                background-color: {COLORS['surface']};
-                color: {COLORS['text_primary']};
-                border: 1px solid {COLORS['vram_border']};
-            }}
-            QMenu::item:selected {{
-                background-color: {COLORS['accent']};
-            }}
-        """)
+        menubar.setStyleSheet(MENUBAR_QSS)
 
         # File menu
         file_menu = menubar.addMenu("File")
@@ -192,13 +298,7 @@ class MainWindow(QMainWindow):
     def _create_header(self, layout):
         """Create the header section"""
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
+        header_frame.setStyleSheet(SURFACE_FRAME_QSS)
 
         header_layout = QHBoxLayout(header_frame)
 
@@ -211,7 +311,7 @@ class MainWindow(QMainWindow):
 
         # CUDA version
         self.cuda_label = QLabel("")
-        self.cuda_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        self.cuda_label.setStyleSheet(SECONDARY_TEXT_QSS)
         header_layout.addWidget(self.cuda_label)
 
         layout.addWidget(header_frame)
@@ -225,12 +325,7 @@ class MainWindow(QMainWindow):
 
         # Gauges row
         gauges_frame = QFrame()
-        gauges_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border-radius: 8px;
-            }}
-        """)
+        gauges_frame.setStyleSheet(GAUGES_FRAME_QSS)
         gauges_layout = QHBoxLayout(gauges_frame)
         gauges_layout.setSpacing(10)
 
@@ -278,13 +373,7 @@ class MainWindow(QMainWindow):
 
         # Memory bar
         memory_frame = QFrame()
-        memory_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
+        memory_frame.setStyleSheet(SURFACE_FRAME_QSS)
         memory_layout = QVBoxLayout(memory_frame)
         self.memory_bar = MemoryBar()
         memory_layout.addWidget(self.memory_bar)
@@ -293,13 +382,7 @@ class MainWindow(QMainWindow):
 
         # Process table
         process_frame = QFrame()
-        process_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
+        process_frame.setStyleSheet(SURFACE_FRAME_QSS)
         process_layout = QVBoxLayout(process_frame)
         self.process_table = ProcessTable()
         process_layout.addWidget(self.process_table)
@@ -317,13 +400,7 @@ class MainWindow(QMainWindow):
 
         # Charts frame
         charts_frame = QFrame()
-        charts_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLORS['surface']};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
+        charts_frame.setStyleSheet(SURFACE_FRAME_QSS)
         charts_layout = QVBoxLayout(charts_frame)
 
         # VRAM history chart
@@ -377,83 +454,119 @@ class MainWindow(QMainWindow):
         """Setup the status bar"""
         self.statusbar = QStatusBar()
         self.setStatusBar(self.statusbar)
-        self.statusbar.setStyleSheet(f"""
-            QStatusBar {{
-                background-color: {COLORS['surface']};
-                color: {COLORS['text_secondary']};
-                border-top: 1px solid {COLORS['vram_border']};
-            }}
-        """)
+        self.statusbar.setStyleSheet(STATUSBAR_QSS)
         self.statusbar.showMessage("Initializing...")
 
-    def _setup_timer(self):
-        """Setup the refresh timer"""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_metrics)
-        self.timer.start(REFRESH_RATE_MS)
+    def _start_polling(self):
+        """Start polling GPU metrics on a background thread"""
+        self._poll_thread = QThread(self)
+        self._poll_worker = MetricsWorker(self.gpu_monitor, self.data_logger)
+        self._poll_worker.moveToThread(self._poll_thread)
 
-    def _update_metrics(self):
-        """Fetch and update all metrics"""
-        metrics = self.gpu_monitor.get_metrics()
+        self._poll_thread.started.connect(self._poll_worker.start)
+        self._poll_thread.finished.connect(self._poll_worker.deleteLater)
+        self._poll_worker.metrics_ready.connect(
+            self._coalescer.submit, Qt.ConnectionType.QueuedConnection
+        )
+
+        self._poll_thread.start()
+
+    def _update_metrics(self, metrics: Optional[GPUMetrics]):
+        """Update all widgets from a metrics snapshot delivered by the poller"""
         if metrics is None:
             self.statusbar.showMessage("Error: Could not read GPU metrics")
             return
 
         self.current_metrics = metrics
-        self.data_logger.add_metrics(metrics)
 
-        # Update header
-        self.gpu_name_label.setText(metrics.device_name)
-        self.cuda_label.setText(f"CUDA {metrics.cuda_version} | Driver {metrics.driver_version}")
+        # Metrics are still recorded by the poller; skip widget work while minimized
+        if self.isMinimized():
+            return
+
+        dirty = self._collect_dirty(metrics)
+
+        # Update header (device info never changes after init)
+        if not self._static_labels_set:
+            self.gpu_name_label.setText(metrics.device_name)
+            self.cuda_label.setText(f"CUDA {metrics.cuda_version} | Driver {metrics.driver_version}")
+            self._static_labels_set = True
+
+        # Update power gauge max and chart range if the limit changed
+        if metrics.power_limit_watts > 0 and metrics.power_limit_watts != self._last_power_limit:
+            self._last_power_limit = metrics.power_limit_watts
+            self.power_gauge.set_max_value(metrics.power_limit_watts)
+            self.power_chart.set_y_range(0, metrics.power_limit_watts * 1.1)
 
-        # Update gauges
+        if metrics.vram_total_gb > 0 and metrics.vram_total_gb != self._last_vram_total:
+            self._last_vram_total = metrics.vram_total_gb
+            self.vram_chart.set_y_range(0, metrics.vram_total_gb * 1.1)
+
+        # Update gauges (set_value skips repaints the 0.1 display can't show)
         self.temp_gauge.set_value(metrics.temperature_celsius)
         self.util_gauge.set_value(metrics.gpu_utilization)
         self.power_gauge.set_value(metrics.power_draw_watts)
         self.vram_gauge.set_value(metrics.vram_used_percent)
 
-        # Update power gauge max if needed
-        if metrics.power_limit_watts > 0:
-            self.power_gauge.max_value = metrics.power_limit_watts
-
         # Update memory bar
-        self.memory_bar.set_memory(
-            metrics.vram_used_bytes,
-            metrics.vram_total_bytes
-        )
+        if "memory" in dirty:
+            self.memory_bar.set_memory(
+                metrics.vram_used_bytes,
+                metrics.vram_total_bytes
+            )
 
         # Update process table
-        self.process_table.update_processes(
-            metrics.processes,
-            metrics.vram_total_bytes
-        )
+        if "processes" in dirty:
+            self.process_table.update_processes(
+                metrics.processes,
+                metrics.vram_total_bytes
+            )
 
         # Update charts
-        x_vram, y_vram = self.data_logger.get_vram_history()
-        self.vram_chart.update_data(x_vram, y_vram)
-        if metrics.vram_total_gb > 0:
-            self.vram_chart.set_y_range(0, metrics.vram_total_gb * 1.1)
-
-        x_util, y_util = self.data_logger.get_utilization_history()
-        self.util_chart.update_data(x_util, y_util)
+        if "charts" in dirty:
+            seconds_ago, series = self.data_logger.get_all_history()
 
-        x_temp, y_temp = self.data_logger.get_temperature_history()
-        self.temp_chart.update_data(x_temp, y_temp)
-
-        x_power, y_power = self.data_logger.get_power_history()
-        self.power_chart.update_data(x_power, y_power)
-        if metrics.power_limit_watts > 0:
-            self.power_chart.set_y_range(0, metrics.power_limit_watts * 1.1)
+            self.vram_chart.update_data(seconds_ago, series["vram"])
+            self.util_chart.update_data(seconds_ago, series["utilization"])
+            self.temp_chart.update_data(seconds_ago, series["temperature"])
+            self.power_chart.update_data(seconds_ago, series["power"])
 
         # Update metrics panel
         self.metrics_panel.update_metrics(metrics)
 
         # Update status bar
         self.statusbar.showMessage(
-            f"Last updated: {metrics.timestamp.strftime('%H:%M:%S')} | "
+            f"Last updated: {time.strftime('%H:%M:%S', time.localtime(metrics.timestamp_wall))} | "
             f"History: {self.data_logger.length} points"
         )
 
+    def _collect_dirty(self, metrics: GPUMetrics) -> set[str]:
+        """
+        Work out which widget groups need updating for this snapshot.
+        The memory bar is dirty when used/total changed; charts are replotted every CHART_UPDATE_EVERY snapshots and the
+        process table every PROCESS_TABLE_UPDATE_EVERY, or at once when a
+        process appears or exits.
+        """
+        dirty = set()
+
+        memory = (metrics.vram_used_bytes, metrics.vram_total_bytes)
+        if memory != self._last_memory:
+            self._last_memory = memory
+            dirty.add("memory")
+
+        self._chart_tick += 1
+        if self._chart_tick >= CHART_UPDATE_EVERY:
+            self._chart_tick = 0
+            dirty.add("charts")
+
+        pids = {p.pid for p in metrics.processes}
+        self._process_tick += 1
+        if pids != self._last_pids or self._process_tick >= PROCESS_TABLE_UPDATE_EVERY:
+            self._last_pids = pids
+            self._process_tick = 0
+            dirty.add("processes")
+
+        return dirty
+
     def _export_data(self, format: str):
         """Export logged data to file"""
         if self.data_logger.length == 0:
@@ -508,7 +621,8 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close"""
-        if self.timer:
-            self.timer.stop()
+        if self._poll_thread is not None:
+            self._poll_thread.quit()
+            self._poll_thread.wait()
         self.gpu_monitor.shutdown()
         event.accept()
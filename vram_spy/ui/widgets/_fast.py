@@ -0,0 +1,60 @@
+"""
+Compiled chart kernels - used when numba is installed, otherwise the numpy
+versions in the chart widgets are used instead
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    @njit(fastmath=True, cache=True, boundscheck=False)
+    def _flush(x, y, out_x, out_y, count, first, lo, hi, last):
+        """Append one bucket's first/min/max/last samples in index order"""
+        a, b = (lo, hi) if lo < hi else (hi, lo)
+        for i in (first, a, b, last):
+            out_x[count] = x[i]
+            out_y[count] = y[i]
+            count += 1
+        return count
+
+    @njit(fastmath=True, cache=True, boundscheck=False)
+    def m4_downsample(x, y, out_x, out_y, target_px):
+        """
+        M4 downsampling in a single pass: split x into target_px equal-width
+        buckets and write the first, min, max and last sample of each, in
+        original order, to out_x/out_y (at least 4 * target_px long).
+        x must be sorted ascending. Returns the number of points written.
+        """
+        n = len(x)
+        x0 = x[0]
+        scale = target_px / (x[n - 1] - x0) if x[n - 1] > x0 else 0.0
+        count = 0
+
+        bucket = -1
+        first = lo = hi = last = 0
+        for i in range(n):
+            b = min(int((x[i] - x0) * scale), target_px - 1)
+            if b != bucket:
+                if bucket >= 0:
+                    count = _flush(x, y, out_x, out_y, count, first, lo, hi, last)
+                bucket = b
+                first = lo = hi = i
+            elif y[i] < y[lo]:
+                lo = i
+            elif y[i] > y[hi]:
+                hi = i
+            last = i
+
+        return _flush(x, y, out_x, out_y, count, first, lo, hi, last)
+
+    # Compile for the chart dtypes now so the first large update doesn't stall
+    _x = np.linspace(0.0, 1.0, 8)
+    _y = np.zeros(8, dtype=np.float32)
+    m4_downsample(_x, _y, np.empty(8), np.empty(8, dtype=np.float32), 2)
+    del _x, _y
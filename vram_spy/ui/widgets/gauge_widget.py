@@ -2,11 +2,13 @@
 Circular Gauge Widget for displaying metrics like temperature, utilization, power
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QRectF
-from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QBrush, QPainterPath
+from typing import Optional
 
-from config import COLORS
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QRectF, QSize
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QPixmap
+
+from config import QCOLORS
 
 
 class GaugeWidget(QWidget):
@@ -14,6 +16,11 @@ class GaugeWidget(QWidget):
     A circular gauge widget with animated arc and centered value display.
     """
 
+    # Arc configuration
+    ARC_WIDTH = 12
+    START_ANGLE = 225 * 16  # Qt uses 1/16th of a degree
+    SPAN_ANGLE = -270 * 16  # Negative for clockwise
+
     def __init__(
         self,
         title: str = "",
@@ -33,58 +40,121 @@ class GaugeWidget(QWidget):
 
         # Colors for different states
         self.colors = {
-            "low": QColor(COLORS["util_low"]),
-            "medium": QColor(COLORS["util_medium"]),
-            "high": QColor(COLORS["util_high"]),
+            "low": QCOLORS["util_low"],
+            "medium": QCOLORS["util_medium"],
+            "high": QCOLORS["util_high"],
         }
+        self._color_lookup = (self.colors["low"], self.colors["medium"], self.colors["high"])
+        self._update_threshold_lookup()
+
+        # Static layers (background arc, unit, title) rendered once per size
+        self._bg_pixmap: Optional[QPixmap] = None
+        self._bg_size = QSize()
 
         self.setMinimumSize(120, 140)
         self.setMaximumSize(180, 200)
 
     def set_value(self, value: float):
-        """Update the gauge value"""
-        self.current_value = max(self.min_value, min(value, self.max_value))
+        """Update the gauge value, repainting only if the displayed value changes"""
+        value = max(self.min_value, min(value, self.max_value))
+        # The value is shown to one decimal; smaller moves are not visible
+        if round(value, 1) == round(self.current_value, 1):
+            return
+        self.current_value = value
+        # Hidden gauges just record the value; showEvent repaints
+        if self.isVisible():
+            self.update()
+
+    def set_max_value(self, max_value: float):
+        """Change the top of the gauge's scale, rescaling the arc"""
+        if max_value == self.max_value:
+            return
+        self.max_value = max_value
         self.update()
 
     def set_thresholds(self, low: float, high: float):
         """Set threshold values for color changes"""
-        self.thresholds = {"low": low, "high": high}
+        thresholds = {"low": low, "high": high}
+        if thresholds == self.thresholds:
+            return
+        self.thresholds = thresholds
+        self._update_threshold_lookup()
+        self.update()
+
+    def _update_threshold_lookup(self):
+        """Resolve the threshold dict once into a (low, high) tuple for painting"""
+        self._thresh_lookup = (self.thresholds.get("low", 50), self.thresholds.get("high", 80))
 
     def _get_color(self) -> QColor:
         """Get color based on current value and thresholds"""
-        if self.current_value < self.thresholds.get("low", 50):
-            return self.colors["low"]
-        elif self.current_value < self.thresholds.get("high", 80):
-            return self.colors["medium"]
-        else:
-            return self.colors["high"]
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        value = self.current_value
+        low, high = self._thresh_lookup
+        return self._color_lookup[(value >= low) + (value >= high)]
+
+    def _gauge_rect(self) -> QRectF:
+        """Square rect the gauge arcs are drawn in"""
+        gauge_size = min(self.width(), self.height() - 30) - 20
+        x_offset = (self.width() - gauge_size) / 2
+        y_offset = 10
+        return QRectF(x_offset, y_offset, gauge_size, gauge_size)
 
-        # Widget dimensions
+    def _build_background(self):
+        """Render the static background arc, unit and title to a pixmap"""
         width = self.width()
         height = self.height()
+        rect = self._gauge_rect()
 
-        # Gauge dimensions
-        gauge_size = min(width, height - 30) - 20
-        x_offset = (width - gauge_size) / 2
-        y_offset = 10
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
 
-        rect = QRectF(x_offset, y_offset, gauge_size, gauge_size)
-
-        # Arc configuration
-        arc_width = 12
-        start_angle = 225 * 16  # Qt uses 1/16th of a degree
-        span_angle = -270 * 16  # Negative for clockwise
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw background arc
-        bg_pen = QPen(QColor(COLORS["gauge_arc"]))
-        bg_pen.setWidth(arc_width)
+        bg_pen = QPen(QCOLORS["gauge_arc"])
+        bg_pen.setWidth(self.ARC_WIDTH)
         bg_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         painter.setPen(bg_pen)
-        painter.drawArc(rect, start_angle, span_angle)
+        painter.drawArc(rect, self.START_ANGLE, self.SPAN_ANGLE)
+
+        # Draw unit below value
+        unit_font = QFont("Segoe UI", 10)
+        painter.setFont(unit_font)
+        painter.setPen(QCOLORS["text_secondary"])
+        unit_rect = QRectF(rect.x(), rect.y() + rect.height() * 0.55, rect.width(), rect.height() * 0.2)
+        painter.drawText(unit_rect, Qt.AlignmentFlag.AlignCenter, self.unit)
+
+        # Draw title below gauge
+        title_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        painter.setFont(title_font)
+        painter.setPen(QCOLORS["text_primary"])
+        title_rect = QRectF(0, height - 25, width, 25)
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
+
+        painter.end()
+
+        self._bg_pixmap = pixmap
+        self._bg_size = self.size()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update()
+
+    def resizeEvent(self, event):
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if self._bg_pixmap is None or self._bg_size != self.size():
+            self._build_background()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        rect = self._gauge_rect()
 
         # Draw value arc
         if self.max_value > self.min_value:
@@ -92,16 +162,16 @@ class GaugeWidget(QWidget):
         else:
             value_ratio = 0
 
-        value_span = int(span_angle * value_ratio)
+        value_span = int(self.SPAN_ANGLE * value_ratio)
 
         value_pen = QPen(self._get_color())
-        value_pen.setWidth(arc_width)
+        value_pen.setWidth(self.ARC_WIDTH)
         value_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         painter.setPen(value_pen)
-        painter.drawArc(rect, start_angle, value_span)
+        painter.drawArc(rect, self.START_ANGLE, value_span)
 
         # Draw center value
-        painter.setPen(QColor(COLORS["text_primary"]))
+        painter.setPen(QCOLORS["text_primary"])
         value_font = QFont("Segoe UI", 18, QFont.Weight.Bold)
         painter.setFont(value_font)
 
@@ -111,21 +181,7 @@ class GaugeWidget(QWidget):
         else:
             value_text = f"{self.current_value:.1f}"
 
-        text_rect = QRectF(x_offset, y_offset + gauge_size * 0.3, gauge_size, gauge_size * 0.4)
+        text_rect = QRectF(rect.x(), rect.y() + rect.height() * 0.3, rect.width(), rect.height() * 0.4)
         painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, value_text)
 
-        # Draw unit below value
-        unit_font = QFont("Segoe UI", 10)
-        painter.setFont(unit_font)
-        painter.setPen(QColor(COLORS["text_secondary"]))
-        unit_rect = QRectF(x_offset, y_offset + gauge_size * 0.55, gauge_size, gauge_size * 0.2)
-        painter.drawText(unit_rect, Qt.AlignmentFlag.AlignCenter, self.unit)
-
-        # Draw title below gauge
-        title_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        painter.setFont(title_font)
-        painter.setPen(QColor(COLORS["text_primary"]))
-        title_rect = QRectF(0, height - 25, width, 25)
-        painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
-
         painter.end()
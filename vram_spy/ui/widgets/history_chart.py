@@ -5,10 +5,63 @@ History Chart Widget - Real-time scrolling line charts using PyQtGraph
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 
-from config import COLORS
+from config import COLORS, QCOLORS, CHART_USE_OPENGL, CHART_ANTIALIAS, HISTORY_POINTS
+from ._fast import HAVE_NUMBA
+if HAVE_NUMBA:
+    from ._fast import m4_downsample
+
+try:
+    import OpenGL  # noqa: F401 - pyqtgraph's GL curve path needs PyOpenGL
+    USE_OPENGL = CHART_USE_OPENGL
+except ImportError:
+    USE_OPENGL = False
+
+if USE_OPENGL:
+    # Curves are drawn as a GL vertex stream instead of building a QPainterPath
+    pg.setConfigOptions(useOpenGL=True, enableExperimental=True)
+
+# Antialiasing is cheap on the GL path but costly in Qt's raster engine, so
+# software-drawn curves only get it when CHART_ANTIALIAS asks for it
+CURVE_ANTIALIAS = USE_OPENGL or CHART_ANTIALIAS
+
+# Zero baseline shared by every chart's fill; charts pass pyqtgraph slices of
+# it, so it is never written to - only replaced by a longer one when needed
+_ZERO_BUF = np.zeros(HISTORY_POINTS, dtype=np.float32)
+
+
+def _zero_baseline(n: int) -> np.ndarray:
+    """n zeros as a view of the shared baseline, growing it if required"""
+    global _ZERO_BUF
+    if n > len(_ZERO_BUF):
+        _ZERO_BUF = np.zeros(n, dtype=np.float32)
+    return _ZERO_BUF[:n]
+
+
+def _downsample_m4(x: np.ndarray, y: np.ndarray, target_px: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    M4 downsampling: split x into target_px equal-width buckets and keep the
+    first, min, max and last sample of each, in their original order. The
+    line drawn through them rasterizes the same as the full series at that
+    width. x must be sorted ascending.
+    """
+    edges = np.linspace(x[0], x[-1], target_px + 1)
+    starts = np.unique(np.searchsorted(x, edges[:-1], side="left"))
+    ends = np.append(starts[1:], len(x)) - 1
+    counts = ends - starts + 1
+
+    # First index in each bucket whose value equals the bucket min / max
+    mins = np.minimum.reduceat(y, starts)
+    maxs = np.maximum.reduceat(y, starts)
+    at_min = np.flatnonzero(y == np.repeat(mins, counts))
+    at_max = np.flatnonzero(y == np.repeat(maxs, counts))
+    argmin = at_min[np.searchsorted(at_min, starts)]
+    argmax = at_max[np.searchsorted(at_max, starts)]
+
+    idx = np.sort(np.stack((starts, argmin, argmax, ends), axis=1), axis=1).ravel()
+    return x[idx], y[idx]
 
 
 class HistoryChart(QWidget):
@@ -32,6 +85,13 @@ class HistoryChart(QWidget):
         self.y_max = y_max
         self.line_color = line_color or COLORS["chart_util"]
 
+        # Copy of the last plotted values, to skip redraws of identical data
+        self._last_y = np.empty(HISTORY_POINTS, dtype=np.float32)
+        self._last_n = 0
+        # Output buffers for the compiled downsampler, grown on demand
+        self._m4_x = np.empty(0)
+        self._m4_y = np.empty(0, dtype=np.float32)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -45,12 +105,9 @@ class HistoryChart(QWidget):
         title_label.setStyleSheet(f"color: {COLORS['text_primary']};")
         layout.addWidget(title_label)
 
-        # Configure PyQtGraph
-        pg.setConfigOptions(antialias=True)
-
         # Create plot widget
         self.plot_widget = pg.PlotWidget()
-        self.plot_widget.setBackground(QColor(COLORS["chart_background"]))
+        self.plot_widget.setBackground(QCOLORS["chart_background"])
         self.plot_widget.setMinimumHeight(100)
 
         # Configure axes
@@ -69,8 +126,10 @@ class HistoryChart(QWidget):
         self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
 
         # Create the line
-        pen = pg.mkPen(color=self.line_color, width=2)
-        self.curve = self.plot_widget.plot([], [], pen=pen)
+        pen = pg.mkPen(color=self.line_color, width=2, cosmetic=True)
+        self.curve = self.plot_widget.plot([], [], pen=pen, antialias=CURVE_ANTIALIAS)
+        self.curve.setDownsampling(auto=True, method="peak")
+        self.curve.setClipToView(True)
 
         # Create a reusable zero baseline curve for the fill
         self.zero_curve = pg.PlotDataItem([0], [0])
@@ -85,18 +144,47 @@ class HistoryChart(QWidget):
 
         layout.addWidget(self.plot_widget)
 
-    def update_data(self, x_data: list[float], y_data: list[float]):
+    def update_data(self, x_data: np.ndarray, y_data: np.ndarray):
         """Update chart with new data"""
-        if not x_data or not y_data:
+        if len(x_data) == 0 or len(y_data) == 0 or not self.isVisible():
+            return
+
+        # DataLogger's arrays are already contiguous, so these don't copy
+        x_array = np.ascontiguousarray(x_data)
+        y_array = np.ascontiguousarray(y_data)
+        n = len(y_array)
+
+        # Compare against a copy of the last plotted values.
+        # A flat full window only shifts by one tick in x, which isn't visible.
+        if n == self._last_n and np.array_equal(y_array, self._last_y[:n]):
             return
+        if n > len(self._last_y):
+            self._last_y = np.empty(n, dtype=np.float32)
+        self._last_y[:n] = y_array
+        self._last_n = n
 
-        x_array = np.array(x_data)
-        y_array = np.array(y_data)
+        # Past ~4 points per pixel extra samples can't change the rasterized line
+        target_px = self.plot_widget.width()
+        if target_px > 0 and n > 4 * target_px:
+            x_array, y_array = self._downsample(x_array, y_array, target_px)
+            n = len(y_array)
 
         self.curve.setData(x_array, y_array)
 
-        # Update the zero baseline curve (reuse instead of recreating)
-        self.zero_curve.setData(x_array, np.zeros_like(y_array))
+        # Baseline is a view of the shared zeros, not a new array per tick
+        self.zero_curve.setData(x_array, _zero_baseline(n))
+
+    def _downsample(self, x: np.ndarray, y: np.ndarray, target_px: int) -> tuple[np.ndarray, np.ndarray]:
+        """M4-downsample to target_px buckets, with the numba kernel when available"""
+        if not HAVE_NUMBA:
+            return _downsample_m4(x, y, target_px)
+
+        size = 4 * target_px
+        if len(self._m4_x) < size or self._m4_x.dtype != x.dtype or self._m4_y.dtype != y.dtype:
+            self._m4_x = np.empty(size, dtype=x.dtype)
+            self._m4_y = np.empty(size, dtype=y.dtype)
+        count = m4_downsample(x, y, self._m4_x, self._m4_y, target_px)
+        return self._m4_x[:count], self._m4_y[:count]
 
     def set_y_range(self, y_min: float, y_max: float):
         """Update Y-axis range"""
@@ -113,7 +201,11 @@ class MultiLineChart(QWidget):
     def __init__(self, title: str = "", parent=None):
         super().__init__(parent)
         self.title = title
-        self.curves = {}
+        # Curves in insertion order, with a name -> index map for update_line
+        self._curve_order: list[str] = []
+        self._curve_items: list[pg.PlotDataItem] = []
+        self._name_to_idx: dict[str, int] = {}
+        self._last_y: list = []  # per curve, copy of the last plotted values
 
         self._setup_ui()
 
@@ -128,12 +220,9 @@ class MultiLineChart(QWidget):
         title_label.setStyleSheet(f"color: {COLORS['text_primary']};")
         layout.addWidget(title_label)
 
-        # Configure PyQtGraph
-        pg.setConfigOptions(antialias=True)
-
         # Create plot widget
         self.plot_widget = pg.PlotWidget()
-        self.plot_widget.setBackground(QColor(COLORS["chart_background"]))
+        self.plot_widget.setBackground(QCOLORS["chart_background"])
         self.plot_widget.setMinimumHeight(120)
 
         # Configure axes
@@ -156,14 +245,41 @@ class MultiLineChart(QWidget):
 
     def add_line(self, name: str, color: str):
         """Add a new line to the chart"""
-        pen = pg.mkPen(color=color, width=2)
-        curve = self.plot_widget.plot([], [], pen=pen, name=name)
-        self.curves[name] = curve
-
-    def update_line(self, name: str, x_data: list[float], y_data: list[float]):
-        """Update a specific line's data"""
-        if name in self.curves and x_data and y_data:
-            self.curves[name].setData(np.array(x_data), np.array(y_data))
+        pen = pg.mkPen(color=color, width=2, cosmetic=True)
+        curve = self.plot_widget.plot([], [], pen=pen, name=name, antialias=CURVE_ANTIALIAS)
+        self._name_to_idx[name] = len(self._curve_items)
+        self._curve_order.append(name)
+        self._curve_items.append(curve)
+        self._last_y.append(None)
+
+    def update_line(self, name: str, x_data: np.ndarray, y_data: np.ndarray):
+        """Update a specific line's data (ndarrays are shared, not copied)"""
+        idx = self._name_to_idx.get(name)
+        if idx is not None and len(x_data) and len(y_data):
+            self._set_line(idx, np.ascontiguousarray(x_data), np.ascontiguousarray(y_data))
+
+    def bulk_update(self, x_data: np.ndarray, y_matrix: np.ndarray):
+        """
+        Update every line at once from a (n_lines, n_points) matrix whose rows
+        follow add_line order and share x_data.
+
+        Rows are passed to pyqtgraph as views, so the matrix must not be
+        modified in place until the next update replaces them.
+        """
+        if not len(x_data):
+            return
+        x_array = np.ascontiguousarray(x_data)
+        for idx in range(len(self._curve_items)):
+            self._set_line(idx, x_array, np.ascontiguousarray(y_matrix[idx]))
+
+    def _set_line(self, idx: int, x_array: np.ndarray, y_array: np.ndarray):
+        """Plot one line unless its values are unchanged since the last update"""
+        last_y = self._last_y[idx]
+        if last_y is not None and np.array_equal(y_array, last_y):
+            return
+        self._last_y[idx] = y_array.copy()
+
+        self._curve_items[idx].setData(x_array, y_array)
 
     def set_y_range(self, y_min: float, y_max: float):
         """Update Y-axis range"""
@@ -2,11 +2,25 @@
 Memory Bar Widget - Shows VRAM usage with segmented display
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QVBoxLayout
-from PyQt6.QtCore import Qt, QRectF
-from PyQt6.QtGui import QPainter, QColor, QFont, QLinearGradient, QPen, QBrush
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QPainter, QColor, QFont, QLinearGradient, QPen, QBrush, QRegion
+
+from config import QCOLORS
+
+_MB = 1024 ** 2
 
-from config import COLORS
+
+@lru_cache(maxsize=256)
+def _format_gb(mb: int) -> str:
+    """Format a whole-MB amount as GB; callers round bytes to MB so repeats hit the cache"""
+    gb = mb / 1024
+    if gb >= 10:
+        return f"{gb:.1f} GB"
+    else:
+        return f"{gb:.2f} GB"
 
 
 class MemoryBar(QWidget):
@@ -14,12 +28,51 @@ class MemoryBar(QWidget):
     A horizontal bar showing VRAM usage with gradient fill and text labels.
     """
 
+    BAR_HEIGHT = 24
+    BAR_MARGIN = 10
+    CORNER_RADIUS = 6
+
+    # Fonts shared by every bar, created with the first bar (needs a QApplication)
+    _TITLE_FONT = None
+    _VALUE_FONT = None
+    _SMALL_FONT = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        if MemoryBar._TITLE_FONT is None:
+            MemoryBar._TITLE_FONT = QFont("Segoe UI", 9, QFont.Weight.Bold)
+            MemoryBar._VALUE_FONT = QFont("Segoe UI", 9)
+            MemoryBar._SMALL_FONT = QFont("Segoe UI", 8)
         self.total_bytes = 0
         self.used_bytes = 0
         self.process_segments = []  # List of (name, bytes) for top processes
 
+        # Right edge of the static "VRAM" title, known after the first paint
+        self._title_right = None
+
+        # Paint areas, recomputed on resize: static title, usage text above
+        # the bar, the bar itself and the free-memory text below it
+        self._title_area = QRect()
+        self._usage_area = QRect()
+        self._bar_area = QRect()
+        self._free_area = QRect()
+
+        # Paint resources, built once and reused by every paintEvent
+        self._bg_rect = QRect()
+        self._used_rect = QRect()
+        self._cover_rect = QRect()
+        self._border_pen = QPen(QCOLORS["vram_border"], 1)
+        self._gradient = QLinearGradient(0, 0, 1, 0)
+        self._gradient.setColorAt(0, QColor("#9333ea"))  # Purple start
+        self._gradient.setColorAt(1, QColor("#7c3aed"))  # Purple end
+        self._used_brush = QBrush(self._gradient)
+        self._brush_span = None  # (start, stop) the used brush was built for
+
+        # Usage text and its pixel width, for the (used, total) they were built from
+        self._usage_key = None
+        self._usage_text = ""
+        self._usage_width = 0
+
         self.setMinimumHeight(60)
         self.setMaximumHeight(80)
 
@@ -28,106 +81,142 @@ class MemoryBar(QWidget):
         Update memory values.
         processes: List of (name, bytes) tuples for segment coloring
         """
+        processes = processes or []
+        if (used_bytes == self.used_bytes and total_bytes == self.total_bytes
+                and processes == self.process_segments):
+            return
+
         self.used_bytes = used_bytes
         self.total_bytes = total_bytes
-        self.process_segments = processes or []
-        self.update()
+        self.process_segments = processes
+
+        if self._title_right is None:
+            self.update()
+        else:
+            # Only the values change; leave the title out of the repaint
+            self.update(self._value_region())
+
+    def _bar_y(self) -> int:
+        return (self.height() - self.BAR_HEIGHT) // 2 + 5
+
+    def _layout_areas(self):
+        """Recompute the paint areas and bar rectangle for the current size"""
+        width = self.width()
+        bar_y = self._bar_y()
+        bar_bottom = bar_y + self.BAR_HEIGHT
+        title_right = self._title_right or 0
+
+        self._bg_rect.setRect(self.BAR_MARGIN, bar_y, width - 2 * self.BAR_MARGIN, self.BAR_HEIGHT)
+        # The areas don't overlap, so a repaint of one never triggers another's
+        # draw. The antialiased border spills half a pixel past the bar on each
+        # side, so the bar area takes the row above it from the text areas.
+        self._title_area.setRect(0, 0, title_right or width, bar_y - 1)
+        self._usage_area.setRect(title_right, 0, width - title_right, bar_y - 1)
+        self._bar_area.setRect(0, bar_y - 1, width, self.BAR_HEIGHT + 2)
+        self._free_area.setRect(0, bar_bottom + 1, width, self.height() - bar_bottom - 1)
+
+    def _value_region(self) -> QRegion:
+        """Usage text, bar and free-memory text areas (a bounding rect would include the title)"""
+        return QRegion(self._usage_area) | QRegion(self._bar_area) | QRegion(self._free_area)
+
+    def resizeEvent(self, event):
+        self._layout_areas()
+        super().resizeEvent(event)
 
     def _format_bytes(self, bytes_val: int) -> str:
         """Format bytes to human-readable string"""
-        gb = bytes_val / (1024 ** 3)
-        if gb >= 10:
-            return f"{gb:.1f} GB"
-        else:
-            return f"{gb:.2f} GB"
+        return _format_gb((bytes_val + _MB // 2) // _MB)
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        region = event.region()
         width = self.width()
-        height = self.height()
 
         # Bar dimensions
-        bar_height = 24
-        bar_y = (height - bar_height) / 2 + 5
-        bar_margin = 10
-        bar_width = width - (bar_margin * 2)
-        corner_radius = 6
-
-        # Draw background
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(COLORS["vram_free"]))
-        painter.drawRoundedRect(
-            QRectF(bar_margin, bar_y, bar_width, bar_height),
-            corner_radius, corner_radius
-        )
-
-        # Draw used portion with gradient
-        if self.total_bytes > 0:
-            used_ratio = self.used_bytes / self.total_bytes
-            used_width = bar_width * used_ratio
-
-            if used_width > 0:
-                gradient = QLinearGradient(bar_margin, 0, bar_margin + used_width, 0)
-                gradient.setColorAt(0, QColor("#9333ea"))  # Purple start
-                gradient.setColorAt(1, QColor("#7c3aed"))  # Purple end
-
-                painter.setBrush(QBrush(gradient))
-
-                # Clip to rounded rect shape
-                if used_width < bar_width:
-                    # Not full - draw rounded left, flat right
-                    painter.drawRoundedRect(
-                        QRectF(bar_margin, bar_y, used_width + corner_radius, bar_height),
-                        corner_radius, corner_radius
-                    )
-                    # Cover the right rounded corner with square
-                    painter.drawRect(
-                        QRectF(bar_margin + used_width, bar_y, corner_radius, bar_height)
-                    )
-                else:
-                    painter.drawRoundedRect(
-                        QRectF(bar_margin, bar_y, used_width, bar_height),
-                        corner_radius, corner_radius
-                    )
-
-        # Draw border
-        painter.setPen(QPen(QColor(COLORS["vram_border"]), 1))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRoundedRect(
-            QRectF(bar_margin, bar_y, bar_width, bar_height),
-            corner_radius, corner_radius
-        )
+        bar_height = self.BAR_HEIGHT
+        bar_y = self._bg_rect.y()
+        bar_margin = self.BAR_MARGIN
+        bar_width = self._bg_rect.width()
+        corner_radius = self.CORNER_RADIUS
+
+        if region.intersects(self._bar_area):
+            # Draw background
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QCOLORS["vram_free"])
+            painter.drawRoundedRect(self._bg_rect, corner_radius, corner_radius)
+
+            # Draw used portion with gradient (whole pixels, integer math)
+            if self.total_bytes > 0:
+                used_width = self.used_bytes * bar_width // self.total_bytes
+
+                if used_width > 0:
+                    # QBrush copies its gradient, so rebuild it only when the span moves
+                    span = (bar_margin, bar_margin + used_width)
+                    if span != self._brush_span:
+                        self._gradient.setStart(span[0], 0)
+                        self._gradient.setFinalStop(span[1], 0)
+                        self._used_brush = QBrush(self._gradient)
+                        self._brush_span = span
+                    painter.setBrush(self._used_brush)
+
+                    # Clip to rounded rect shape
+                    if used_width < bar_width:
+                        # Not full - draw rounded left, flat right
+                        self._used_rect.setRect(bar_margin, bar_y, used_width + corner_radius, bar_height)
+                        painter.drawRoundedRect(self._used_rect, corner_radius, corner_radius)
+                        # Cover the right rounded corner with square
+                        self._cover_rect.setRect(bar_margin + used_width, bar_y, corner_radius, bar_height)
+                        painter.drawRect(self._cover_rect)
+                    else:
+                        self._used_rect.setRect(bar_margin, bar_y, used_width, bar_height)
+                        painter.drawRoundedRect(self._used_rect, corner_radius, corner_radius)
+
+            # Draw border
+            painter.setPen(self._border_pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(self._bg_rect, corner_radius, corner_radius)
 
         # Draw text labels
-        painter.setPen(QColor(COLORS["text_primary"]))
+        painter.setPen(QCOLORS["text_primary"])
 
         # Title on top left
-        title_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
-        painter.setFont(title_font)
-        painter.drawText(bar_margin, int(bar_y - 5), "VRAM")
+        if self._title_right is None or region.intersects(self._title_area):
+            painter.setFont(self._TITLE_FONT)
+            painter.drawText(bar_margin, bar_y - 5, "VRAM")
+            if self._title_right is None:
+                self._title_right = bar_margin + painter.fontMetrics().horizontalAdvance("VRAM ")
+                self._layout_areas()
 
         # Usage on top right
-        if self.total_bytes > 0:
-            used_text = f"{self._format_bytes(self.used_bytes)} / {self._format_bytes(self.total_bytes)}"
-            percent = (self.used_bytes / self.total_bytes) * 100
-            usage_text = f"{used_text} ({percent:.1f}%)"
-        else:
-            usage_text = "N/A"
-
-        value_font = QFont("Segoe UI", 9)
-        painter.setFont(value_font)
-        text_width = painter.fontMetrics().horizontalAdvance(usage_text)
-        painter.drawText(int(width - bar_margin - text_width), int(bar_y - 5), usage_text)
+        if region.intersects(self._usage_area):
+            self._draw_usage_text(painter, width, bar_y)
 
         # Free memory indicator at bottom
-        if self.total_bytes > 0:
+        if self.total_bytes > 0 and region.intersects(self._free_area):
             free_bytes = self.total_bytes - self.used_bytes
             free_text = f"Free: {self._format_bytes(free_bytes)}"
-            painter.setPen(QColor(COLORS["text_secondary"]))
-            small_font = QFont("Segoe UI", 8)
-            painter.setFont(small_font)
-            painter.drawText(bar_margin, int(bar_y + bar_height + 15), free_text)
+            painter.setPen(QCOLORS["text_secondary"])
+            painter.setFont(self._SMALL_FONT)
+            painter.drawText(bar_margin, bar_y + bar_height + 15, free_text)
 
         painter.end()
+
+    def _draw_usage_text(self, painter: QPainter, width: int, bar_y: int):
+        """Draw the used / total (percent) text right-aligned above the bar"""
+        painter.setPen(QCOLORS["text_primary"])
+        painter.setFont(self._VALUE_FONT)
+
+        key = (self.used_bytes, self.total_bytes)
+        if key != self._usage_key:
+            if self.total_bytes > 0:
+                used_text = f"{self._format_bytes(self.used_bytes)} / {self._format_bytes(self.total_bytes)}"
+                percent = (self.used_bytes / self.total_bytes) * 100
+                self._usage_text = f"{used_text} ({percent:.1f}%)"
+            else:
+                self._usage_text = "N/A"
+            self._usage_width = painter.fontMetrics().horizontalAdvance(self._usage_text)
+            self._usage_key = key
+
+        painter.drawText(int(width - self.BAR_MARGIN - self._usage_width), bar_y - 5, self._usage_text)
@@ -2,6 +2,8 @@
 Metrics Panel - Grid display of current GPU metrics
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QWidget, QGridLayout, QLabel, QVBoxLayout, QFrame
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
@@ -9,13 +11,34 @@ from PyQt6.QtGui import QFont
 from config import COLORS
 
 
+def _format_bw(bytes_per_sec: int) -> str:
+    """Format a PCIe throughput in bytes/s as MB/s or GB/s"""
+    return _format_bw_mb((bytes_per_sec + (1 << 19)) >> 20)
+
+
+@lru_cache(maxsize=256)
+def _format_bw_mb(mb: int) -> str:
+    if mb >= 1000:
+        return f"{mb / 1024:.1f} GB/s"
+    return f"{mb} MB/s"
+
+
 class MetricCard(QFrame):
     """A single metric display card"""
 
+    # Fonts shared by every card, created with the first card (needs a QApplication)
+    _TITLE_FONT = None
+    _VALUE_FONT = None
+
     def __init__(self, title: str, unit: str = "", parent=None):
         super().__init__(parent)
+        if MetricCard._TITLE_FONT is None:
+            MetricCard._TITLE_FONT = QFont("Segoe UI", 9)
+            MetricCard._VALUE_FONT = QFont("Segoe UI", 16, QFont.Weight.Bold)
         self.title = title
         self.unit = unit
+        self._last_value = None
+        self._last_color = None
 
         self._setup_ui()
 
@@ -35,21 +58,25 @@ class MetricCard(QFrame):
 
         # Title
         self.title_label = QLabel(self.title)
-        self.title_label.setFont(QFont("Segoe UI", 9))
+        self.title_label.setFont(self._TITLE_FONT)
         self.title_label.setStyleSheet(f"color: {COLORS['text_secondary']}; border: none;")
         layout.addWidget(self.title_label)
 
         # Value
         self.value_label = QLabel("--")
-        self.value_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.value_label.setFont(self._VALUE_FONT)
         self.value_label.setStyleSheet(f"color: {COLORS['text_primary']}; border: none;")
         layout.addWidget(self.value_label)
 
-    def set_value(self, value: str, color: str = None):
-        """Update the displayed value"""
-        self.value_label.setText(f"{value}{self.unit}")
-        if color:
+    def set_value(self, value: str | int, color: str = None):
+        """Update the displayed value (no-op when value and color are unchanged)"""
+        if value != self._last_value:
+            self.value_label.setText(f"{value}{self.unit}")
+            self._last_value = value
+        # setStyleSheet invalidates the label's style, so only call it on a real change
+        if color and color != self._last_color:
             self.value_label.setStyleSheet(f"color: {color}; border: none;")
+            self._last_color = color
 
 
 class MetricsPanel(QWidget):
@@ -102,9 +129,9 @@ class MetricsPanel(QWidget):
     def update_metrics(self, metrics):
         """Update all metric cards from GPUMetrics object"""
         # Clocks
-        self.cards["graphics_clock"].set_value(str(metrics.graphics_clock_mhz))
-        self.cards["memory_clock"].set_value(str(metrics.memory_clock_mhz))
-        self.cards["sm_clock"].set_value(str(metrics.sm_clock_mhz))
+        self.cards["graphics_clock"].set_value(metrics.graphics_clock_mhz)
+        self.cards["memory_clock"].set_value(metrics.memory_clock_mhz)
+        self.cards["sm_clock"].set_value(metrics.sm_clock_mhz)
 
         # Utilization
         self.cards["memory_util"].set_value(f"{metrics.memory_utilization:.1f}")
@@ -114,22 +141,8 @@ class MetricsPanel(QWidget):
         # PCIe
         self.cards["pcie_gen"].set_value(f"Gen {metrics.pcie_gen} x{metrics.pcie_width}")
 
-        # Format PCIe throughput
-        tx_mb = metrics.pcie_tx_bytes_per_sec / (1024 * 1024)
-        rx_mb = metrics.pcie_rx_bytes_per_sec / (1024 * 1024)
-
-        if tx_mb >= 1000:
-            tx_text = f"{tx_mb/1024:.1f} GB/s"
-        else:
-            tx_text = f"{tx_mb:.0f} MB/s"
-
-        if rx_mb >= 1000:
-            rx_text = f"{rx_mb/1024:.1f} GB/s"
-        else:
-            rx_text = f"{rx_mb:.0f} MB/s"
-
-        self.cards["pcie_tx"].set_value(tx_text)
-        self.cards["pcie_rx"].set_value(rx_text)
+        self.cards["pcie_tx"].set_value(_format_bw(metrics.pcie_tx_bytes_per_sec))
+        self.cards["pcie_rx"].set_value(_format_bw(metrics.pcie_rx_bytes_per_sec))
 
         # Misc
         self.cards["pstate"].set_value(metrics.performance_state)
@@ -2,16 +2,39 @@
 Process Table Widget - Shows per-process GPU memory usage
 """
 
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QWidget,
     QVBoxLayout, QLabel, QAbstractItemView
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtGui import QBrush, QFont
 
-from config import COLORS
+from config import COLORS, QCOLORS
 from core.metrics import ProcessInfo
 
+_MB = 1024 ** 2
+
+# Colour bands for the % of total column: <= 20, <= 50, above
+_PERCENT_BANDS = np.array([20.0, 50.0])
+_PERCENT_LEVELS = ("util_low", "util_medium", "util_high")
+
+# Most detached table items kept for reuse when rows come back
+ITEM_POOL_SIZE = 128
+
+
+@lru_cache(maxsize=256)
+def _format_vram(mb: int) -> str:
+    """VRAM cell text for a whole-MB amount; process usage rarely moves between polls"""
+    if mb >= 1024:
+        return f"{mb / 1024:.2f} GB"
+    else:
+        return f"{mb} MB"
+
 
 class ProcessTable(QWidget):
     """
@@ -20,6 +43,14 @@ class ProcessTable(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Items for each table row, created once and updated in place
+        self._rows: list[tuple[QTableWidgetItem, ...]] = []
+        # Values last shown in each row, so unchanged cells are skipped
+        self._row_values: list[Optional[tuple]] = []
+        # Foreground brushes for the % of total colour bands, indexed by band
+        self._percent_brushes = tuple(QBrush(QCOLORS[level]) for level in _PERCENT_LEVELS)
+        # Items from removed rows, reused for new rows as processes come and go
+        self._item_pool: list[QTableWidgetItem] = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -86,53 +117,91 @@ class ProcessTable(QWidget):
 
     def update_processes(self, processes: list[ProcessInfo], total_vram: int):
         """Update the table with new process data"""
-        self.table.setRowCount(len(processes))
+        # Rebuilding rows touches every cell; repaint the table once at the end
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._populate(processes, total_vram)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def _populate(self, processes: list[ProcessInfo], total_vram: int):
+        """Update the table rows in place (called with table updates disabled)"""
+        count = len(processes)
+        if count != len(self._rows):
+            # Detach the surplus rows' items so setRowCount doesn't delete them
+            for row in range(count, len(self._rows)):
+                self._release_row(row)
+            self.table.setRowCount(count)
+            del self._rows[count:]
+            del self._row_values[count:]
+            for row in range(len(self._rows), count):
+                self._rows.append(self._create_row(row))
+                self._row_values.append(None)
+
+        # Arithmetic for every row in one vectorized pass
+        used = np.fromiter(
+            (proc.vram_used_bytes for proc in processes), dtype=np.int64, count=count
+        )
+        used_mb = ((used + _MB // 2) // _MB).tolist()
+        if total_vram > 0:
+            percent = used * (100.0 / total_vram)
+            percent_texts = [f"{p:.1f}%" for p in percent.tolist()]
+            levels = np.digitize(percent, _PERCENT_BANDS, right=True).tolist()
+        else:
+            percent_texts = ["N/A"] * count
+            levels = [None] * count
 
         for row, proc in enumerate(processes):
-            # Process name
-            name_item = QTableWidgetItem(proc.name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 0, name_item)
-
-            # PID
-            pid_item = QTableWidgetItem(str(proc.pid))
-            pid_item.setFlags(pid_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            pid_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 1, pid_item)
-
-            # VRAM usage
-            vram_mb = proc.vram_used_bytes / (1024 ** 2)
-            vram_gb = proc.vram_used_bytes / (1024 ** 3)
-
-            if vram_gb >= 1:
-                vram_text = f"{vram_gb:.2f} GB"
-            else:
-                vram_text = f"{vram_mb:.0f} MB"
-
-            vram_item = QTableWidgetItem(vram_text)
-            vram_item.setFlags(vram_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            vram_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 2, vram_item)
-
-            # Percentage of total (calculate once)
-            percent = None
-            if total_vram > 0:
-                percent = (proc.vram_used_bytes / total_vram) * 100
-                percent_text = f"{percent:.1f}%"
-            else:
-                percent_text = "N/A"
-
-            percent_item = QTableWidgetItem(percent_text)
-            percent_item.setFlags(percent_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            percent_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-
-            # Color code based on usage
-            if percent is not None:
-                if percent > 50:
-                    percent_item.setForeground(QColor(COLORS["util_high"]))
-                elif percent > 20:
-                    percent_item.setForeground(QColor(COLORS["util_medium"]))
+            vram_text = _format_vram(used_mb[row])
+            percent_text = percent_texts[row]
+            level = levels[row]
+
+            values = (proc.name, proc.pid, vram_text, percent_text, level)
+            last = self._row_values[row]
+            if values == last:
+                continue
+
+            name_item, pid_item, vram_item, percent_item = self._rows[row]
+            if last is None or last[0] != proc.name:
+                name_item.setText(proc.name)
+            if last is None or last[1] != proc.pid:
+                pid_item.setText(str(proc.pid))
+            if last is None or last[2] != vram_text:
+                vram_item.setText(vram_text)
+            if last is None or last[3] != percent_text:
+                percent_item.setText(percent_text)
+            if last is None or last[4] != level:
+                # Color code based on usage
+                if level is None:
+                    percent_item.setData(Qt.ItemDataRole.ForegroundRole, None)
                 else:
-                    percent_item.setForeground(QColor(COLORS["util_low"]))
+                    percent_item.setForeground(self._percent_brushes[level])
 
-            self.table.setItem(row, 3, percent_item)
+            self._row_values[row] = values
+
+    def _create_row(self, row: int) -> tuple[QTableWidgetItem, ...]:
+        """Fill a new row with read-only items, reusing pooled ones first"""
+        left = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        right = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        alignments = (left, Qt.AlignmentFlag.AlignCenter, right, right)
+
+        items = []
+        for column, alignment in enumerate(alignments):
+            if self._item_pool:
+                item = self._item_pool.pop()
+            else:
+                item = QTableWidgetItem()
+                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            item.setTextAlignment(alignment)
+            self.table.setItem(row, column, item)
+            items.append(item)
+        return tuple(items)
+
+    def _release_row(self, row: int):
+        """Take a row's items out of the table and pool them, up to ITEM_POOL_SIZE"""
+        for column in range(self.table.columnCount()):
+            item = self.table.takeItem(row, column)
+            if item is not None and len(self._item_pool) < ITEM_POOL_SIZE:
+                item.setText("")
+                item.setData(Qt.ItemDataRole.ForegroundRole, None)
+                self._item_pool.append(item)